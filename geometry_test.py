@@ -0,0 +1,79 @@
+import json
+import os
+import tempfile
+import unittest
+from board import Board
+from solvers.geometry import get_geometry
+from solvers.utils import astar, manhattan_distance
+from solvers.admissible_heuristic import misplaced_tiles
+from solvers.inadmissible_heuristic import nilsson_sequence_score
+
+
+class TestPuzzleGeometry(unittest.TestCase):
+    def test_geometry_is_cached(self):
+        self.assertIs(get_geometry(4), get_geometry(4))
+        self.assertIs(get_geometry(3), get_geometry(3.0))
+
+    def test_perimeter_3x3(self):
+        self.assertEqual(get_geometry(3).perimeter, (0, 1, 2, 5, 8, 7, 6, 3))
+
+    def test_perimeter_4x4(self):
+        self.assertEqual(get_geometry(4).perimeter, (0, 1, 2, 3, 7, 11, 15, 14, 13, 12, 8, 4))
+
+    def test_neighbours_match_board_moves(self):
+        for size in (3, 4, 5):
+            geometry = get_geometry(size)
+            for idx in range(size * size):
+                state = [i for i in range(1, size * size)]
+                state.insert(idx, -1)
+                board = Board(size, state)
+                self.assertEqual([d for d, _ in geometry.neighbours[idx]], board.possible_moves())
+
+    def test_rows(self):
+        self.assertEqual(get_geometry(4).rows(list(range(16)))[1], [4, 5, 6, 7])
+
+
+class TestHeuristicsAnySize(unittest.TestCase):
+    def test_solved_boards_score_zero(self):
+        for size in (3, 4, 5):
+            board = Board(size)
+            self.assertEqual(manhattan_distance(board), 0)
+            self.assertEqual(misplaced_tiles(board), 0)
+
+    def test_manhattan_4x4(self):
+        board = Board(4, [-1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 1])
+        self.assertEqual(manhattan_distance(board), 6)
+        self.assertEqual(misplaced_tiles(board), 1)
+
+    def test_nilsson_solved_boards_have_no_sequence_bonus(self):
+        for size in (3, 4, 5):
+            self.assertEqual(nilsson_sequence_score(Board(size)), 0)
+
+    def test_perimeter_successor_3x3(self):
+        successor = get_geometry(3).perimeter_successor
+        self.assertEqual([successor[t] for t in (1, 2, 3, 6, 8, 7, 4)], [2, 3, 6, 8, 7, 4, 1])
+        self.assertEqual(successor[5], 0)
+
+    def test_nilsson_hard_3(self):
+        board = Board(3, [6, 4, 7, 8, 5, -1, 3, 2, 1])
+        self.assertEqual(nilsson_sequence_score(board), 29)
+
+    def test_astar_solves_5x5_and_dumps_rows(self):
+        state = [i for i in range(1, 25)] + [-1]
+        state[23], state[24] = state[24], state[23]
+        state[18], state[23] = state[23], state[18]
+        board = Board(5, state)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "dump.json")
+            result = astar(board, manhattan_distance, save_path=path)
+            with open(path, encoding="utf-8") as f:
+                dump = json.load(f)
+
+        self.assertEqual(result["result"]["path"], ["Down", "Right"])
+        self.assertEqual(len(dump["visited"][0]["state"]), 5)
+        self.assertEqual(len(dump["visited"][0]["state"][0]), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,6 @@
-from board import Board
-from solvers.admissible_heuristic import admissible_heuristic
-from solvers.inadmissible_heuristic import inadmissible_heuristic
-from solvers.admissible_heuristic_precise import admissible_heuristic_precise
-from solvers.ucs_solver import Reporter, uniform_cost_search
+import argparse
+from importlib import import_module
+from math import isqrt
 
 EASY_1 = [1,2,3,
           4,-1,6,
@@ -16,49 +14,128 @@ MEDIUM_2 = [7,2,4,
 HARD_1 = [8,6,7,
           2,5,4,
           3,-1,1]
-HARD_2 = [1,2,3,
-          4,5,6,
-          8,-1,7]
 HARD_3 = [6,4,7,
           8,5,-1,
           3,2,1]
 
-def menu():
-    print("=== 8-Puzzle Solver ===")
-    print("Escolha o algoritmo a ser utilizado:")
-    print("1 - Custo Uniforme")
-    print("2 - A* (heurística não admissível)")
-    print("3 - A* (heurística admissível simples)")
-    print("4 - A* (heurística admissível precisa)")
-
-    escolha = input("Digite o número do algoritmo: ").strip()
-    if escolha not in ["1", "2", "3", "4"]:
-        print("Opção inválida!")
-        return
+BOARDS = {
+    "EASY_1": EASY_1,
+    "MEDIUM_1": MEDIUM_1,
+    "MEDIUM_2": MEDIUM_2,
+    "HARD_1": HARD_1,
+    "HARD_3": HARD_3,
+}
+
+# Os solvers são referenciados por nome e só importados depois que o usuário
+# escolhe um deles, para que `--help` e execuções simples não paguem o custo
+# de carregar todos os módulos (e as tabelas que eles venham a construir).
+UCS_SOLVER = ("solvers.ucs_solver", "uniform_cost_search", "./uniform_cost_search.txt")
+
+HEURISTICS = {
+    "misplaced": ("solvers.admissible_heuristic", "admissible_heuristic",
+                  "admissible_heuristic.json", "Admissível simples"),
+    "manhattan": ("solvers.admissible_heuristic_precise", "admissible_heuristic_precise",
+                  "admissible_heuristic_precise.json", "Admissível precisa"),
+    "nilsson": ("solvers.inadmissible_heuristic", "inadmissible_heuristic",
+                "inadmissible_heuristic.json", "Não admissível"),
+}
+
+TRACE_LEVELS = ["none", "full"]
+
+
+def load_solver(module_name: str, function_name: str):
+    return getattr(import_module(module_name), function_name)
+
+
+def is_solvable(board: list[int], size: int) -> bool:
+    tiles = [v for v in board if v != -1]
+    inversions = sum(1 for i in range(len(tiles)) for j in range(i + 1, len(tiles)) if tiles[i] > tiles[j])
+
+    if size % 2 == 1:
+        return inversions % 2 == 0
+
+    # N par: cada movimento vertical troca a paridade das inversões, então conta
+    # também quantas linhas o vazio está acima da última (onde fica no objetivo)
+    blank_rows_from_bottom = size - 1 - board.index(-1) // size
+    return (inversions + blank_rows_from_bottom) % 2 == 0
+
+
+def parse_board(value: str) -> list[int]:
+    if value.upper() in BOARDS:
+        board = list(BOARDS[value.upper()])
+    else:
+        try:
+            board = [int(x) for x in value.replace(" ", "").split(",")]
+        except ValueError:
+            raise argparse.ArgumentTypeError(
+                f"tabuleiro inválido: {value!r} (use um nome pré-definido ou números separados por vírgula)")
 
-    tabuleiro = HARD_3
+    size = isqrt(len(board))
+    if size * size != len(board) or sorted(board) != [-1] + list(range(1, len(board))):
+        raise argparse.ArgumentTypeError(
+            f"tabuleiro inválido: {value!r} (esperado 1..N-1 e -1 para o espaço vazio, N quadrado perfeito)")
 
-    b = Board(3, tabuleiro)
+    if not is_solvable(board, size):
+        raise argparse.ArgumentTypeError(f"tabuleiro sem solução: {value!r}")
 
-    if escolha == "1":
-        reporter = Reporter(file_path="./uniform_cost_search.txt")
+    return board
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="N-Puzzle Solver")
+    parser.add_argument("--algorithm", choices=["ucs", "astar"], default="astar",
+                        help="algoritmo de busca (padrão: astar)")
+    parser.add_argument("--heuristic", choices=sorted(HEURISTICS), default="manhattan",
+                        help="heurística usada pelo A* (padrão: manhattan)")
+    parser.add_argument("--board", type=parse_board, default=HARD_3,
+                        help=f"tabuleiro inicial: um de {', '.join(BOARDS)} "
+                             "ou números separados por vírgula, -1 para o vazio (padrão: HARD_3)")
+    parser.add_argument("--trace-level", choices=TRACE_LEVELS, default="full",
+                        help="none: apenas o resultado; full: grava o rastro da busca em --output (padrão: full)")
+    parser.add_argument("--output",
+                        help="arquivo de rastro com --trace-level full (padrão depende do algoritmo); "
+                             "não pode ser combinado com --trace-level none")
+    return parser
+
+
+def run(args: argparse.Namespace):
+    from board import Board
+
+    b = Board(isqrt(len(args.board)), args.board)
+    trace = args.trace_level == "full"
+
+    if args.algorithm == "ucs":
+        module_name, function_name, default_output = UCS_SOLVER
+        output = (args.output or default_output) if trace else None
+
+        Reporter = load_solver(module_name, "Reporter")
+        uniform_cost_search = load_solver(module_name, function_name)
+        reporter = Reporter(file_path=output, log_states=trace)
         uniform_cost_search(b, reporter)
-        print("Resultado Algoritmo 1 (Custo Uniforme):", "./uniform_cost_search.txt")
+        if output:
+            print("Resultado Custo Uniforme:", output)
 
         return
-    elif escolha == "2":
-        result = inadmissible_heuristic(b)
-        print("Resultado Algoritmo 2 (Não admissível):", result["result"])
-    elif escolha == "3":
-        result = admissible_heuristic(b)
-        print("Resultado Algoritmo 3 (Admissível simples):", result["result"])
-    elif escolha == "4":
-        result = admissible_heuristic_precise(b)
-        print("Resultado Algoritmo 4 (Admissível precisa):", result["result"])
 
-    print("Arquivos gerados:")
-    print("Fronteira:", result["frontier_file"])
+    module_name, function_name, default_output, label = HEURISTICS[args.heuristic]
+    output = (args.output or default_output) if trace else None
+
+    solver = load_solver(module_name, function_name)
+    result = solver(b, save_path=output)
+    print(f"Resultado A* ({label}):", result["result"])
+
+    if output:
+        print("Arquivos gerados:")
+        print("Fronteira:", result["frontier_file"])
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.output and args.trace_level == "none":
+        parser.error("--output exige --trace-level full")
+    run(args)
 
 
 if __name__ == "__main__":
-    menu()
+    main()
@@ -0,0 +1,58 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MAIN = os.path.join(ROOT, "main.py")
+
+# budget_ms é o teto para a mediana; None apenas reporta (referência do interpretador)
+CASES = {
+    "python main.py --help": {
+        "args": [MAIN, "--help"],
+        "budget_ms": 1000,
+    },
+    "python main.py (EASY_1, trace none)": {
+        "args": [MAIN, "--board", "EASY_1", "--trace-level", "none"],
+        "budget_ms": 1500,
+    },
+    "python -c pass (baseline)": {
+        "args": ["-c", "pass"],
+        "budget_ms": None,
+    },
+}
+
+
+def measure(args, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main(runs: int = 10) -> int:
+    print(f"=== Startup Benchmark ({runs} runs) ===")
+    failed = False
+    for label, case in CASES.items():
+        timings = measure(case["args"], runs)
+        median_ms = statistics.median(timings) * 1000
+        budget_ms = case["budget_ms"]
+
+        if budget_ms is None:
+            verdict = ""
+        elif median_ms <= budget_ms:
+            verdict = f"OK   (budget {budget_ms} ms)"
+        else:
+            verdict = f"FAIL (budget {budget_ms} ms)"
+            failed = True
+
+        print(f"{label:40} median {median_ms:7.1f} ms   min {min(timings) * 1000:7.1f} ms   {verdict}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10))
@@ -0,0 +1,99 @@
+import argparse
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+import main
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MAIN = os.path.join(ROOT, "main.py")
+
+LOADED_SOLVERS = "print(sorted(m for m in sys.modules if m.startswith('solvers')))"
+
+
+def run_python(*args):
+    return subprocess.run([sys.executable, *args], cwd=ROOT,
+                          capture_output=True, text=True)
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_main_does_not_load_solvers(self):
+        completed = run_python("-c", "import sys, main; " + LOADED_SOLVERS)
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertEqual(completed.stdout.strip(), "[]")
+
+    def test_help_does_not_load_solvers(self):
+        completed = run_python("-c",
+            "import contextlib, io, sys, main\n"
+            "with contextlib.redirect_stdout(io.StringIO()):\n"
+            "    try:\n"
+            "        main.main(['--help'])\n"
+            "    except SystemExit:\n"
+            "        pass\n"
+            + LOADED_SOLVERS)
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertEqual(completed.stdout.strip(), "[]")
+
+
+class TestCommandLine(unittest.TestCase):
+    def test_trivial_solve(self):
+        completed = run_python(MAIN, "--algorithm", "astar", "--heuristic", "manhattan",
+                               "--board", "EASY_1", "--trace-level", "none")
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertIn("'status': 'solved'", completed.stdout)
+
+    def test_invalid_board_rejected(self):
+        completed = run_python(MAIN, "--board", "1,2,3")
+        self.assertNotEqual(completed.returncode, 0)
+
+    def test_unsolvable_board_rejected(self):
+        for board in ("2,1,3,4,5,6,7,8,-1",
+                      "1,2,3,4,5,6,7,8,9,10,11,12,13,15,14,-1"):
+            completed = run_python(MAIN, "--board", board, "--trace-level", "none")
+            self.assertNotEqual(completed.returncode, 0)
+            self.assertIn("sem solução", completed.stderr)
+
+    def test_presets_are_validated(self):
+        completed = run_python(MAIN, "--board", "HARD_2", "--trace-level", "none")
+        self.assertNotEqual(completed.returncode, 0)
+        self.assertIn("tabuleiro inválido", completed.stderr)
+
+    def test_all_presets_solvable(self):
+        for name in main.BOARDS:
+            self.assertEqual(main.parse_board(name), main.BOARDS[name])
+
+    def test_unsolvable_preset_rejected(self):
+        with mock.patch.dict(main.BOARDS, {"BROKEN": [1,2,3,4,5,6,8,-1,7]}):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                main.parse_board("BROKEN")
+
+    def test_solvable_even_board_accepted(self):
+        completed = run_python(MAIN, "--board", "1,2,3,4,5,6,7,8,9,10,11,-1,13,14,15,12",
+                               "--trace-level", "none")
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertIn("'path': ['Down']", completed.stdout)
+
+    def test_ucs_solves_4x4(self):
+        completed = run_python(MAIN, "--algorithm", "ucs", "--trace-level", "none",
+                               "--board", "1,2,3,4,5,6,7,8,9,10,11,12,13,14,-1,15")
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertIn("Right", completed.stdout)
+
+    def test_ucs_keys_distinguish_multi_digit_tiles(self):
+        from board import Board
+        from solvers.ucs_solver import board_to_key
+        tail = list(range(2, 11)) + list(range(12, 16)) + [-1]
+        self.assertNotEqual(board_to_key(Board(4, [1, 11] + tail)),
+                            board_to_key(Board(4, [11, 1] + tail)))
+
+    def test_output_requires_trace(self):
+        completed = run_python(MAIN, "--board", "EASY_1", "--trace-level", "none",
+                               "--output", "x.json")
+        self.assertNotEqual(completed.returncode, 0)
+        self.assertFalse(os.path.exists(os.path.join(ROOT, "x.json")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,16 +1,18 @@
+from typing import Optional
 from board import Board
+from .geometry import get_geometry
 from .utils import astar
 
 def misplaced_tiles(board: Board) -> int:
-    arr = board.get_board()
+    goal_index = get_geometry(board.game_size).goal_index
     count = 0
-    for i, v in enumerate(arr):
+    for i, v in enumerate(board.get_board()):
         if v == -1:
             continue
-        if v != i + 1:
+        if goal_index[v] != i:
             count += 1
     return count
 
-def admissible_heuristic(start_board: Board):
+def admissible_heuristic(start_board: Board, save_path: Optional[str] = "admissible_heuristic.json"):
     return astar(start_board, misplaced_tiles,
-                 save_path="admissible_heuristic.json")
+                 save_path=save_path)
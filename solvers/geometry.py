@@ -0,0 +1,92 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Tuple
+from board import Direction
+
+
+@dataclass(frozen=True)
+class PuzzleGeometry:
+    size: int
+    cells: int
+    # goal_index[tile] -> posição do tile no objetivo (tile 0 não existe, -1 é o vazio)
+    goal_index: Tuple[int, ...]
+    row_of: Tuple[int, ...]
+    col_of: Tuple[int, ...]
+    # distance[tile][idx] -> distância de Manhattan do tile em idx até seu objetivo
+    distance: Tuple[Tuple[int, ...], ...]
+    # borda percorrida no sentido horário a partir do canto superior esquerdo
+    perimeter: Tuple[int, ...]
+    # perimeter_successor[tile] -> tile que o segue na borda do objetivo, pulando o vazio
+    # (0 para tiles cuja posição objetivo não está na borda: nunca têm sucessor correto)
+    perimeter_successor: Tuple[int, ...]
+    # neighbours[idx] -> (direção, índice alvo) na ordem de Board.possible_moves
+    neighbours: Tuple[Tuple[Tuple[Direction, int], ...], ...]
+
+    def rows(self, state: List[int]) -> List[List[int]]:
+        return [list(state[i:i + self.size]) for i in range(0, self.cells, self.size)]
+
+
+def _perimeter(size: int) -> Tuple[int, ...]:
+    if size == 1:
+        return (0,)
+
+    top = [c for c in range(size)]
+    right = [r * size + size - 1 for r in range(1, size)]
+    bottom = [(size - 1) * size + c for c in range(size - 2, -1, -1)]
+    left = [r * size for r in range(size - 2, 0, -1)]
+    return tuple(top + right + bottom + left)
+
+
+def _neighbours(size: int, idx: int) -> Tuple[Tuple[Direction, int], ...]:
+    row, col = divmod(idx, size)
+    moves = []
+    if col != 0:
+        moves.append((Direction.Left, idx - 1))
+    if col != size - 1:
+        moves.append((Direction.Right, idx + 1))
+    if row != 0:
+        moves.append((Direction.Up, idx - size))
+    if row != size - 1:
+        moves.append((Direction.Down, idx + size))
+    return tuple(moves)
+
+
+def _perimeter_successor(cells: int, perimeter: Tuple[int, ...]) -> Tuple[int, ...]:
+    # no objetivo a posição idx guarda o tile idx + 1 e a última posição fica vazia
+    ring = [idx + 1 for idx in perimeter if idx != cells - 1]
+    successor = [0] * cells
+    for i, tile in enumerate(ring):
+        successor[tile] = ring[(i + 1) % len(ring)]
+    return tuple(successor)
+
+
+@lru_cache(maxsize=None)
+def _build_geometry(size: int) -> PuzzleGeometry:
+    cells = size * size
+    row_of = tuple(idx // size for idx in range(cells))
+    col_of = tuple(idx % size for idx in range(cells))
+    goal_index = (-1,) + tuple(range(cells - 1))
+    perimeter = _perimeter(size)
+
+    distance = [()]
+    for tile in range(1, cells):
+        target = goal_index[tile]
+        distance.append(tuple(abs(row_of[idx] - row_of[target]) + abs(col_of[idx] - col_of[target])
+                              for idx in range(cells)))
+
+    return PuzzleGeometry(
+        size=size,
+        cells=cells,
+        goal_index=goal_index,
+        row_of=row_of,
+        col_of=col_of,
+        distance=tuple(distance),
+        perimeter=perimeter,
+        perimeter_successor=_perimeter_successor(cells, perimeter),
+        neighbours=tuple(_neighbours(size, idx) for idx in range(cells)),
+    )
+
+
+def get_geometry(game_size) -> PuzzleGeometry:
+    # Board.parse produz game_size float; normaliza antes de consultar o cache
+    return _build_geometry(int(game_size))
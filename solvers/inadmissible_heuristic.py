@@ -1,22 +1,26 @@
+from typing import Optional
 from board import Board
+from .geometry import get_geometry
 from .utils import astar, manhattan_distance
 
 def nilsson_sequence_score(board: Board) -> float:
     arr = board.get_board()
     dist = manhattan_distance(board)
 
-    seq = [0, 1, 2, 5, 8, 7, 6, 3]
+    geometry = get_geometry(board.game_size)
+    seq = geometry.perimeter
+    successor = geometry.perimeter_successor
     bonus = 0
     for i in range(len(seq)):
         current_val = arr[seq[i]]
         next_val = arr[seq[(i + 1) % len(seq)]]
         if current_val == -1 or next_val == -1:
             continue
-        if (current_val + 1) % 9 != next_val % 9:
+        if successor[current_val] != next_val:
             bonus += 2
 
     return dist + bonus
 
-def inadmissible_heuristic(start_board: Board):
+def inadmissible_heuristic(start_board: Board, save_path: Optional[str] = "inadmissible_heuristic.json"):
     return astar(start_board, lambda b: nilsson_sequence_score(b),
-                 save_path="inadmissible_heuristic.json")
+                 save_path=save_path)
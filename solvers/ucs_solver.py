@@ -3,6 +3,7 @@ import heapq
 from queue import PriorityQueue
 from typing import List, Optional, Set, Tuple
 from board import Board, Direction
+from .geometry import get_geometry
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -19,8 +20,9 @@ class SearchNode:
 
 
 class Reporter:
-    def __init__(self, file_path: Optional[str] = None):
+    def __init__(self, file_path: Optional[str] = None, log_states: bool = True):
         self.file_path = file_path
+        self.log_states = log_states
         self.start_time = None
         self.visited_states = 0
         self.max_frontier_size = 0
@@ -44,8 +46,10 @@ class Reporter:
     def report_state(self, node: SearchNode, frontier_size: int):
         self.visited_states += 1
         self.max_frontier_size = max(self.max_frontier_size, frontier_size)
-        board_str = '\n'.join(' '.join(f"{n:2}" for n in node.board.get_board()[i:i+node.board.game_size])
-                             for i in range(0, len(node.board.get_board()), node.board.game_size))
+        if not self.log_states:
+            return
+        rows = get_geometry(node.board.game_size).rows(node.board.get_board())
+        board_str = '\n'.join(' '.join(f"{n:2}" for n in row) for row in rows)
         self.log(f"\nVisiting state (cost={node.cost}):\n{board_str}")
 
     def report_solution(self, final_node: Optional[SearchNode]):
@@ -90,12 +94,13 @@ class Reporter:
             print("Sequence of moves to solve the puzzle:")
             print(" -> ".join(moves if moves else ["Already solved!"]))
             
-            print("\n=== Detailed Solution ===")
-            print(f"Final State")
-            self.report_state(final_node, 0)
+            if self.log_states:
+                print("\n=== Detailed Solution ===")
+                print(f"Final State")
+                self.report_state(final_node, 0)
 
-def board_to_key(b: Board):
-        return ''.join(str(x) for x in b.get_board())
+def board_to_key(b: Board) -> Tuple[int, ...]:
+    return tuple(b.get_board())
 
 def uniform_cost_search(initial_board: Board, reporter: Reporter):
     reporter.start_search()
@@ -4,6 +4,7 @@ import time
 from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from board import Board, Direction
+from .geometry import PuzzleGeometry, get_geometry
 
 
 @dataclass(order=True)
@@ -37,26 +38,18 @@ def reconstruct_path(node: Node) -> List[Direction]:
 
 
 def manhattan_distance(board: Board) -> int:
-    arr = board.get_board()
-    size = board.game_size
-    dist = 0
-    for idx, val in enumerate(arr):
-        if val == -1:
-            continue
-        target = val - 1
-        cur_row, cur_col = divmod(idx, int(size))
-        tar_row, tar_col = divmod(target, int(size))
-        dist += abs(cur_row - tar_row) + abs(cur_col - tar_col)
-    return dist
+    distance = get_geometry(board.game_size).distance
+    return sum(distance[val][idx] for idx, val in enumerate(board.get_board()) if val != -1)
 
 # ---------------- Algoritmo A* ----------------
 def astar(
     start_board: Board,
     heuristic_fn: Callable[[Board], float],
-    save_path: str = "frontier_visited.json",
+    save_path: Optional[str] = "frontier_visited.json",
 ) -> Dict:
     start_time = time.perf_counter()
     start_key = board_to_key(start_board)
+    geometry = get_geometry(start_board.game_size)
 
     open_heap: List[PrioritizedItem] = []
     open_map: Dict[Tuple[int, ...], Node] = {}
@@ -86,7 +79,8 @@ def astar(
         if cur_node.board.is_soluted():
             end_time = time.perf_counter()
             path = reconstruct_path(cur_node)
-            _dump_frontier_visited(open_map, closed_map, save_path)
+            if save_path:
+                _dump_frontier_visited(open_map, closed_map, save_path, geometry)
             return {
                 "result": {
                     "path": [d.name for d in path],
@@ -99,20 +93,14 @@ def astar(
                 "frontier_file": save_path
             }
 
-        for direction in cur_node.board.possible_moves():
-            new_board = Board(cur_node.board.game_size, cur_node.board.get_board().copy())
-            if direction == Direction.Left:
-                new_board.move_left()
-            elif direction == Direction.Right:
-                new_board.move_right()
-            elif direction == Direction.Up:
-                new_board.move_up()
-            elif direction == Direction.Down:
-                new_board.move_down()
-            else:
-                continue
+        cur_state = cur_node.board.get_board()
+        empty_index = cur_state.index(-1)
+        for direction, target_idx in geometry.neighbours[empty_index]:
+            child_state = cur_state.copy()
+            child_state[empty_index], child_state[target_idx] = child_state[target_idx], child_state[empty_index]
+            new_board = Board(cur_node.board.game_size, child_state)
 
-            child_key = board_to_key(new_board)
+            child_key = tuple(child_state)
             tentative_g = cur_node.g + 1
 
             if child_key in closed_map and tentative_g >= closed_map[child_key].g:
@@ -133,7 +121,8 @@ def astar(
         max_frontier_size = max(max_frontier_size, len(open_heap))
 
     end_time = time.perf_counter()
-    _dump_frontier_visited(open_map, closed_map, save_path)
+    if save_path:
+        _dump_frontier_visited(open_map, closed_map, save_path, geometry)
     return {
         "result": {
             "path": None,
@@ -148,12 +137,10 @@ def astar(
 
 def _dump_frontier_visited(open_map: Dict[Tuple[int, ...], Node],
                            closed_map: Dict[Tuple[int, ...], Node],
-                           json_path: str) -> None:
-    def format_3x3(state: list[int]) -> list[list[int]]:
-        return [state[i:i+3] for i in range(0, 9, 3)]
-
-    frontier_dump = [{"state": format_3x3(list(key))} for key in open_map]
-    visited_dump = [{"state": format_3x3(list(key))} for key in closed_map]
+                           json_path: str,
+                           geometry: PuzzleGeometry) -> None:
+    frontier_dump = [{"state": geometry.rows(key)} for key in open_map]
+    visited_dump = [{"state": geometry.rows(key)} for key in closed_map]
 
     out = {
         "frontier_count": len(frontier_dump),